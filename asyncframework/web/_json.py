@@ -0,0 +1,77 @@
+# -*- coding:utf-8 -*-
+"""Json adapter which uses orjson if it is installed and packets.json otherwise.
+Whatever orjson can't handle is passed to packets.json: non-str keys, integers
+wider than 64 bits and documents orjson rejects (e.g. with NaN) are processed
+exactly as without orjson. Documents with 19 or more digits in a row are always
+parsed with packets.json, as orjson would turn such integers into floats.
+The only difference left is that orjson dumps NaN and Infinity floats
+as null instead of the non-standard NaN/Infinity literals.
+
+loads(data: Union[str, bytes]) -> Any:
+    deserialize json from str or bytes
+
+dumps(obj: Any) -> str:
+    serialize object to json string
+
+dumpb(obj: Any, default: Optional[Callable[[Any], Any]] = None) -> bytes:
+    serialize object to utf-8 encoded json bytes, `default` converts objects
+    which are not serializable natively
+"""
+from __future__ import annotations
+from typing import Any, Union, Optional, Callable
+import re
+from packets import json
+
+try:
+    import orjson
+except ImportError:
+    orjson = None # type: ignore[assignment]
+
+
+__all__ = ['loads', 'dumps', 'dumpb']
+
+
+if orjson is not None:
+    _OPTIONS = orjson.OPT_NON_STR_KEYS
+    _long_digits = re.compile('[0-9]{19}')
+    _long_digits_b = re.compile(b'[0-9]{19}')
+
+    def _has_long_digits(data: Union[str, bytes]) -> bool:
+        if isinstance(data, str):
+            return _long_digits.search(data) is not None
+        if isinstance(data, (bytes, bytearray)):
+            return _long_digits_b.search(data) is not None
+        return False
+
+    def loads(data: Union[str, bytes]) -> Any:
+        if _has_long_digits(data):
+            return json.loads(data)
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            return json.loads(data)
+
+    def dumps(obj: Any) -> str:
+        try:
+            return orjson.dumps(obj, option=_OPTIONS).decode('utf-8')
+        except TypeError:
+            return json.dumps(obj)
+
+    def dumpb(obj: Any, default: Optional[Callable[[Any], Any]] = None) -> bytes:
+        try:
+            return orjson.dumps(obj, default=default, option=_OPTIONS)
+        except TypeError:
+            if default is None:
+                return json.dumps(obj).encode('utf-8')
+            return json.dumps(obj, default=default).encode('utf-8')
+else:
+    def loads(data: Union[str, bytes]) -> Any:
+        return json.loads(data)
+
+    def dumps(obj: Any) -> str:
+        return json.dumps(obj)
+
+    def dumpb(obj: Any, default: Optional[Callable[[Any], Any]] = None) -> bytes:
+        if default is None:
+            return json.dumps(obj).encode('utf-8')
+        return json.dumps(obj, default=default).encode('utf-8')
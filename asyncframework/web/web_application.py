@@ -1,6 +1,8 @@
 # -*- coding:utf-8 -*-
-from typing import Type, Optional, Callable, Mapping, Any, Iterable
+from __future__ import annotations
+from typing import Type, Optional, Callable, Mapping, Any, Iterable, Awaitable
 import asyncio
+from functools import wraps
 from logging import Logger
 from aiohttp.web import Application, Request
 from aiohttp.web_response import StreamResponse
@@ -13,7 +15,22 @@ from aiohttp.abc import AbstractStreamWriter
 from .web_request import WebRequest
 
 
-__all__ = ['WebApplication']
+__all__ = ['WebApplication', 'with_controller']
+
+
+def with_controller(handler: Callable[[WebRequest, Any], Awaitable[StreamResponse]]) -> Callable[[WebRequest], Awaitable[StreamResponse]]:
+    """Decorate the handler to get the request controller as the second argument.
+
+    Args:
+        handler (Callable[[WebRequest, Any], Awaitable[StreamResponse]]): the handler accepting request and controller
+
+    Returns:
+        Callable[[WebRequest], Awaitable[StreamResponse]]: the aiohttp handler
+    """
+    @wraps(handler)
+    async def wrapper(request: WebRequest) -> StreamResponse:
+        return await handler(request, request.controller)
+    return wrapper
 
 
 class WebApplication(Application):
@@ -22,6 +39,7 @@ class WebApplication(Application):
 
     def __init__(self, *, 
         controller_factory: Optional[Callable] = None,
+        controller: Any = None,
         logger: Logger = web_logger, 
         router: Optional[UrlDispatcher] = None, 
         middlewares: Iterable[Callable] = (), 
@@ -29,8 +47,13 @@ class WebApplication(Application):
         client_max_size: int = 1024 ** 2, 
         loop: Optional[asyncio.AbstractEventLoop] = None, 
         ) -> None:
+        if controller_factory is not None and controller is not None:
+            raise ValueError('controller_factory and controller can not be used at the same time')
         super().__init__(logger=logger, router=router, middlewares=middlewares, handler_args=handler_args, client_max_size=client_max_size, loop=loop)
         self._controller_factory = controller_factory
+        self._controller = controller
+        if controller is not None:
+            self['controller'] = controller
     
     def _make_request(
         self,
@@ -49,5 +72,5 @@ class WebApplication(Application):
             task,
             self._loop,
             client_max_size=self._client_max_size,
-            controller=self._controller_factory() if self._controller_factory else None
+            controller=self._controller_factory() if self._controller_factory else self._controller
         )
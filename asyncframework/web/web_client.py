@@ -1,32 +1,80 @@
 # -*- coding:utf-8 -*-
-from typing import Optional, Dict, Any
+from __future__ import annotations
+from typing import Optional, Dict, Any, Sequence, Tuple, List, Mapping, ClassVar
 import aiohttp
+from aiohttp.payload import BytesPayload
 import asyncio
+import codecs
+import re
+from functools import partialmethod
 import time
 from asyncframework.log.log import get_logger
-from packets import json
+from . import _json
 
 
 __all__ = ['WebClient', 'WebClientResponse']
 
 
+_json_content_type = re.compile(r'^application/(?:[\w.+-]+?\+)?json')
+
+
 class WebClientResponse():
     """Web client response for easy use
     """
-    __slots__ = ['__status', '__method', '__text', '__json', '__headers']
+    __slots__ = ['__status', '__method', '__text', '__json', '__headers', '__pooled']
+
+    _pool: ClassVar[List['WebClientResponse']] = []
+    _POOL_MAX: ClassVar[int] = 1024
 
     __status: int
     __method: str
     __text: str
     __json: Any
-    __headers: Dict[str, str]
+    __headers: Mapping[str, str]
+    __pooled: bool
 
-    def __init__(self, status: int, method: str, text: str, json: Any, headers: Dict[str, str]) -> None:
+    def __init__(self, status: int, method: str, text: str, json: Any, headers: Mapping[str, str]) -> None:
+        self._reset(status, method, text, json, headers)
+
+    def _reset(self, status: int, method: str, text: str, json: Any, headers: Mapping[str, str]) -> None:
         self.__status = status
         self.__method = method
         self.__text = text
         self.__json = json
         self.__headers = headers
+        self.__pooled = False
+
+    def __enter__(self) -> 'WebClientResponse':
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.release()
+
+    @classmethod
+    def acquire(cls, status: int, method: str, text: str, json: Any, headers: Mapping[str, str]) -> 'WebClientResponse':
+        """Get the response from the pool of released ones or create the new one
+
+        Returns:
+            WebClientResponse: the response
+        """
+        if cls._pool and cls is WebClientResponse:
+            response = cls._pool.pop()
+            response._reset(status, method, text, json, headers)
+            return response
+        return cls(status, method, text, json, headers)
+
+    def release(self) -> None:
+        """Return the response to the pool for reuse.
+        The response must not be used after release.
+        """
+        if self.__pooled:
+            return
+        self.__pooled = True
+        self.__text = ''
+        self.__json = None
+        self.__headers = {}
+        if len(self._pool) < self._POOL_MAX and type(self) is WebClientResponse:
+            self._pool.append(self)
 
     @property
     def status(self) -> int:
@@ -45,7 +93,7 @@ class WebClientResponse():
         return self.__json
 
     @property
-    def headers(self) -> Dict[str, str]:
+    def headers(self) -> Mapping[str, str]:
         return self.__headers
 
 
@@ -61,8 +109,11 @@ class WebClient:
     _last_req_time: float
     _force_close: bool
     _limit: int
+    _limit_per_host: int
+    _keepalive_timeout: Optional[float]
+    _ttl_dns_cache: Optional[int]
 
-    def __init__(self, request_timeout: float = 10, session_timeout: float = 600.0, force_close: bool =False, limit: int = 100):
+    def __init__(self, request_timeout: float = 10, session_timeout: float = 600.0, force_close: bool =False, limit: int = 100, limit_per_host: int = 0, keepalive_timeout: Optional[float] = None, ttl_dns_cache: Optional[int] = 10):
         """Constructor
 
         Args:
@@ -70,6 +121,9 @@ class WebClient:
             session_timeout (float, optional): session timeout in seconds. Defaults to 600.
             force_close (bool, optional): if True will force close and do reconnect after each request (and between redirects). Defaults to False.
             limit (int, optional): max amount of simultaneous connections. Defaults to 100.
+            limit_per_host (int, optional): max amount of simultaneous connections to the same host (0 is unlimited). Defaults to 0.
+            keepalive_timeout (Optional[float], optional): how long to keep idle connections alive in seconds, ignored if force_close is True. Defaults to aiohttp default.
+            ttl_dns_cache (Optional[int], optional): how long to cache resolved host addresses in seconds, None caches forever. Defaults to 10.
         """
         self._client_timeout = request_timeout
         self._client = None
@@ -79,94 +133,89 @@ class WebClient:
         self._last_req_time = 0
         self._force_close = force_close
         self._limit = limit
+        self._limit_per_host = limit_per_host
+        self._keepalive_timeout = keepalive_timeout
+        self._ttl_dns_cache = ttl_dns_cache
 
-    async def get(self, url: str, **kwargs) -> WebClientResponse:
-        """GET request
-
-        Args:
-            url (str): URL
-
-        Returns:
-            WebClientResponse: the response
-        """
-        return await self._request('GET', url, **kwargs)
-
-    async def head(self, url: str, **kwargs) -> WebClientResponse:
-        """HEAD request
-
-        Args:
-            url (str): URL
-
-        Returns:
-            WebClientResponse: the response
-        """
-        return await self._request('HEAD', url, **kwargs)
-
-    async def options(self, url: str, **kwargs) -> WebClientResponse:
-        """OPTIONS request
-
-        Args:
-            url (str): URL
-
-        Returns:
-            WebClientResponse: the response
-        """
-        return await self._request('OPTIONS', url, **kwargs)
-
-    async def trace(self, url: str, **kwargs) -> WebClientResponse:
-        """TRACE request
-
-        Args:
-            url (str): URL
-
-        Returns:
-            WebClientResponse: the response
-        """
-        return await self._request('TRACE', url, **kwargs)
-
-    async def patch(self, url: str, **kwargs) -> WebClientResponse:
-        """PATCH request
-
-        Args:
-            url (str): URL
+    async def __aenter__(self) -> 'WebClient':
+        if self._client is None:
+            await self._init_session()
+        return self
 
-        Returns:
-            WebClientResponse: the response
-        """
-        return await self._request('PATCH', url, **kwargs)
+    async def __aexit__(self, *args) -> None:
+        await self.close()
 
-    async def post(self, url: str, **kwargs) -> WebClientResponse:
-        """POST request
+    async def request(self, method: str, url: str, **kwargs) -> WebClientResponse:
+        """Request with any HTTP method
 
         Args:
+            method (str): HTTP method
             url (str): URL
 
         Returns:
             WebClientResponse: the response
         """
-        return await self._request('POST', url, **kwargs)
-
-    async def put(self, url: str, **kwargs) -> WebClientResponse:
-        """PUT request
-
-        Args:
-            url (str): URL
+        client = self._client
+        if client is None:
+            await self._init_session()
+            client = self._client
+            if client is None:
+                self.log.error(f'ClientSession is None!')
+                raise RuntimeError(f'Somehow ClientSession is None!')
+
+        self._last_req_time = time.monotonic()
+
+        json_data = kwargs.pop('json', None)
+        if json_data is not None:
+            if kwargs.get('data') is not None:
+                raise ValueError('data and json parameters can not be used at the same time')
+            kwargs['data'] = BytesPayload(_json.dumpb(json_data), content_type='application/json')
+
+        async with client.request(method, url, **kwargs) as resp:
+            raw = await resp.read()
+            encoding = resp.get_encoding()
+            text = raw.decode(encoding)
+            js = None
+            if _json_content_type.match(resp.content_type) and raw.strip():
+                try:
+                    js = _json.loads(raw if codecs.lookup(encoding).name == 'utf-8' else text)
+                except ValueError:
+                    pass
+            r = WebClientResponse.acquire(
+                status = resp.status,
+                method = resp.method,
+                text = text,
+                json = js,
+                headers = resp.headers
+            )
+            return r
 
-        Returns:
-            WebClientResponse: the response
-        """
-        return await self._request('PUT', url, **kwargs)
+    get = partialmethod(request, 'GET')
+    head = partialmethod(request, 'HEAD')
+    options = partialmethod(request, 'OPTIONS')
+    trace = partialmethod(request, 'TRACE')
+    patch = partialmethod(request, 'PATCH')
+    post = partialmethod(request, 'POST')
+    put = partialmethod(request, 'PUT')
+    delete = partialmethod(request, 'DELETE')
 
-    async def delete(self, url: str, **kwargs) -> WebClientResponse:
-        """DELETE request
+    async def bulk(self, requests: Sequence[Tuple[str, str, Dict[str, Any]]]) -> List[WebClientResponse]:
+        """Run several requests concurrently over the shared session.
+        The session is opened once for the whole batch, the amount of simultaneous
+        connections is still bounded by the connector `limit`.
 
         Args:
-            url (str): URL
+            requests (Sequence[Tuple[str, str, Dict[str, Any]]]): the sequence of (method, URL, kwargs)
 
         Returns:
-            WebClientResponse: the response
+            List[WebClientResponse]: the responses in the order of requests
         """
-        return await self._request('DELETE', url, **kwargs)
+        if not requests:
+            return []
+        if not self._client:
+            await self._init_session()
+        self._last_req_time = time.monotonic()
+        return await asyncio.gather(*[self.request(method, url, **kwargs) for method, url, kwargs in requests])
 
     async def close(self, wait: bool = False):
         """Close session and all the active connections.
@@ -185,41 +234,16 @@ class WebClient:
     async def _close_after(self):
         try:
             while True:
-                self.log.debug(f'Sleeping for {self._session_timeout} sec')
-                await asyncio.sleep(self._session_timeout)
-                if time.time() >= self._last_req_time + self._session_timeout:
+                delay = self._last_req_time + self._session_timeout - time.monotonic()
+                if delay <= 0:
                     self.log.warn('Close session by timeout')
                     await self.close(wait=True)
                     break
-                else:
-                    self.log.debug(f'Resetting timeout {time.time()} {self._last_req_time + self._session_timeout}')
+                self.log.debug(f'Sleeping for {delay} sec')
+                await asyncio.sleep(delay)
         except asyncio.CancelledError:
             pass
 
-    async def _request(self, method: str, url: str, **kwargs) -> WebClientResponse:
-        if not self._client:
-            await self._init_session()
-
-        self._last_req_time = time.time()
-
-        if self._client is None:
-            self.log.error(f'ClientSession is None!')
-            raise RuntimeError(f'Somehow ClientSession is None!')
-        
-        async with self._client.request(method, url, **kwargs) as resp:
-            try:
-                js = await resp.json(loads=json.loads)
-            except aiohttp.client_exceptions.ContentTypeError:
-                js = None
-            r = WebClientResponse(
-                status = resp.status,
-                method = resp.method,
-                text = await resp.text(),
-                json = js,
-                headers = dict(resp.headers)
-            )
-            return r
-
     async def _init_session(self):
         if self._wait_open and not self._wait_open.done():
             await self._wait_open
@@ -228,8 +252,19 @@ class WebClient:
             self._wait_open = asyncio.Future()
             self.log.debug(f'Opening session with timeout: {self._client_timeout}')
             client_timeout = aiohttp.ClientTimeout(total=self._client_timeout)
-            tcp = aiohttp.TCPConnector(force_close=self._force_close, limit=self._limit)
-            self._client = aiohttp.ClientSession(connector=tcp, timeout=client_timeout, json_serialize=json.dumps)
+            connector_args: Dict[str, Any] = {}
+            if self._keepalive_timeout is not None and not self._force_close:
+                connector_args['keepalive_timeout'] = self._keepalive_timeout
+            tcp = aiohttp.TCPConnector(
+                force_close=self._force_close,
+                limit=self._limit,
+                limit_per_host=self._limit_per_host,
+                ttl_dns_cache=self._ttl_dns_cache,
+                enable_cleanup_closed=True,
+                **connector_args
+            )
+            self._client = aiohttp.ClientSession(connector=tcp, timeout=client_timeout)
+            self._last_req_time = time.monotonic()
             self._close_after_task = asyncio.ensure_future(self._close_after())
             self._wait_open.set_result(None)
 
@@ -1,10 +1,14 @@
 # -*- coding:utf-8 -*-
-from typing import Dict, Any, Optional, Generator, TypeVar, Type, Sequence, Tuple
+from __future__ import annotations
+from typing import Dict, Any, Optional, TypeVar, Type, Sequence, Tuple, Iterable, Union
+import codecs
+from itertools import chain
+from urllib.parse import urlencode
 from aiohttp.web import HTTPBadRequest, Request
 from aiohttp.helpers import reify
 from asyncframework.log.log import get_logger
 from packets.packet import Packet
-from packets import json
+from . import _json
 
 
 __all__ = ['WebRequest', 'WebRequestArgsPacket']
@@ -14,19 +18,36 @@ _not_found = object()
 T = TypeVar('T', bound='WebRequestArgsPacket')
 
 
+def _flatten(items: Iterable[Tuple[str, Any]]) -> Dict[str, Any]:
+    """Flatten multidict items in a single pass.
+    Repeated keys are collected to the list of values.
+
+    Args:
+        items (Iterable[Tuple[str, Any]]): multidict items
+
+    Returns:
+        Dict[str, Any]: the flattened dict
+    """
+    flat: Dict[str, Any] = {}
+    for key, value in items:
+        existing = flat.get(key, _not_found)
+        if existing is _not_found:
+            flat[key] = value
+        elif isinstance(existing, list):
+            existing.append(value)
+        else:
+            flat[key] = [existing, value]
+    return flat
+
+
 class WebRequest(Request):
     """The subclass of `Request` with additional features
     """
     log = get_logger('EnhancedRequest')
-
-    _flat_args: Optional[Dict[str, Any]]
-    _flat_headers: Optional[Dict[str, Any]]
-    _controller = None
+    ATTRS = Request.ATTRS | frozenset(['_controller'])
 
     def __init__(self, *args: Any, controller = None, **kwargs: Any) -> None:
         super().__init__(*args, **kwargs)
-        self._flat_args = None
-        self._flat_headers = None
         self._controller = controller
 
     @property
@@ -51,20 +72,14 @@ class WebRequest(Request):
         """
         return self.headers.get('X-Real-IP', super().remote)
 
-    @property
+    @reify
     def flat_headers(self) -> Dict[str, Any]: # type: ignore[override]
         """Flatten the headers
 
         Returns:
             Dict[str, Any]: the flattened headers
         """
-        if self._flat_headers is None:
-            self._flat_headers = {}
-            aiohttp_headers = super().headers
-            for key, value in aiohttp_headers.items():
-                v = aiohttp_headers.getall(key)
-                self._flat_headers[key] = v if len(v) > 1 else value
-        return self._flat_headers
+        return _flatten(super().headers.items())
 
     async def flat_args(self) -> Dict[str, Any]:
         """Flatten the args
@@ -72,15 +87,14 @@ class WebRequest(Request):
         Returns:
             Dict[str, Any]: the flattened args
         """
-        if self._flat_args is None:
-            decoded_args = {}
-            all_args = (await self.post()).copy()
-            all_args.extend(self.query)
-            for key, value in all_args.items():
-                v = all_args.getall(key)
-                decoded_args[key] = v if len(v) > 1 else value
-            self._flat_args = decoded_args
-        return self._flat_args
+        decoded_args = self._cache.get('flat_args', _not_found)
+        if decoded_args is _not_found:
+            if self.method in self.POST_METHODS and self.body_exists:
+                decoded_args = _flatten(chain((await self.post()).items(), self.query.items()))
+            else:
+                decoded_args = _flatten(self.query.items())
+            self._cache['flat_args'] = decoded_args
+        return decoded_args
 
     async def body(self) -> Optional[str]:
         """Return the body of the request
@@ -98,9 +112,8 @@ class WebRequest(Request):
         Returns:
             str: generated URI
         """
-        all_args = await self.flat_args()
-        if all_args:
-            params = '&'.join(f'{arg}={value}' for arg, value in all_args.items())
+        params = urlencode(await self.flat_args(), doseq=True)
+        if params:
             return f'{self.path}?{params}'
         else:
             return self.path
@@ -115,24 +128,31 @@ class WebRequest(Request):
         Returns:
             Sequence[Any]: the tuple of extracted values of args
         """
-        default_args = dict.fromkeys(arg_names + tuple(defaults.keys()), _not_found)
-        default_args.update(defaults)
-        self_args = await self.flat_args()
-        def next() -> Generator:
-            for k,v in default_args.items():
-                v = self_args.get(k, v)
-                if v is _not_found:
-                    raise HTTPBadRequest(reason=f'Missing argument {k}')
-                yield v
-        return tuple(next())
+        get_arg = (await self.flat_args()).get
+        names = dict.fromkeys(arg_names, _not_found)
+        names.update(defaults)
+        values = [get_arg(k, v) for k, v in names.items()]
+        if _not_found in values:
+            missing = list(names)[values.index(_not_found)]
+            raise HTTPBadRequest(reason=f'Missing argument {missing}')
+        return tuple(values)
     
-    def get_auth(self) -> Tuple[Optional[str], Optional[str]]:
+    @reify
+    def auth(self) -> Tuple[Optional[str], Optional[str]]:
+        """Get the type and the token from Authorization header
+
+        Returns:
+            Tuple[Optional[str], Optional[str]]: the auth type and the token or (None, None) if no auth
+        """
         auth = self.headers.get('Authorization', None)
         if auth:
             auth_type, token = auth.split(maxsplit=1)
             return(auth_type, token)
         return (None, None)
 
+    def get_auth(self) -> Tuple[Optional[str], Optional[str]]:
+        return self.auth
+
 
 class WebRequestArgsPacket(Packet):
     """Class to convert request args to Packet
@@ -174,7 +194,12 @@ class WebRequestArgsPacket(Packet):
         Returns:
             T: constructed packet
         """
-        data = await request.body()
+        charset = request.charset
+        data: Union[str, bytes]
+        if charset is None or codecs.lookup(charset).name == 'utf-8':
+            data = await request.read()
+        else:
+            data = await request.text()
         return cls._loads_or_bad_request(data)
 
     @classmethod
@@ -187,7 +212,7 @@ class WebRequestArgsPacket(Packet):
     @classmethod
     def _loads_or_bad_request(cls: Type[T], data) -> T:
         try:
-            parsed = json.loads(data)
+            parsed = _json.loads(data)
         except (ValueError, TypeError) as e:
             raise HTTPBadRequest(reason=f'Error json deserializing "{e}"')
         else:
@@ -1,30 +1,91 @@
 # -*- coding: utf-8 -*-
-from typing import Union, Optional
+from __future__ import annotations
+from typing import Union, Optional, Callable, Dict, Type, Any
+from aiohttp import hdrs
 from aiohttp.web import Response
 from aiohttp.typedefs import LooseHeaders
+from multidict import CIMultiDict
 from packets.packet import PacketBase
-from packets import json
+from . import _json
 
 
 __all__ = ['make_response']
 
 
-def make_response(source: Union[PacketBase, dict, str], status: int = 200, headers: Optional[LooseHeaders] = None) -> Response:
+_JSON_CONTENT_TYPE = 'application/json; charset=utf-8'
+_ResponseFactory = Callable[[Any, int, Optional[LooseHeaders], Optional[str]], Response]
+
+
+def _dump_packet(obj: Any) -> Any:
+    if isinstance(obj, PacketBase):
+        return obj.dump()
+    raise TypeError(f'Object of type {type(obj).__name__} is not JSON serializable')
+
+
+def _json_headers(headers: Optional[LooseHeaders], content_type: Optional[str]) -> CIMultiDict:
+    json_headers: CIMultiDict = CIMultiDict(headers) if headers is not None else CIMultiDict()
+    if hdrs.CONTENT_TYPE in json_headers:
+        if content_type is not None:
+            raise ValueError('passing both Content-Type header and content_type param is forbidden')
+    else:
+        json_headers[hdrs.CONTENT_TYPE] = content_type or _JSON_CONTENT_TYPE
+    return json_headers
+
+
+def _packet_response(source: PacketBase, status: int, headers: Optional[LooseHeaders], content_type: Optional[str]) -> Response:
+    return Response(body=source.dumps().encode('utf-8'), status=status, headers=_json_headers(headers, content_type))
+
+
+def _json_response(source: Union[dict, list], status: int, headers: Optional[LooseHeaders], content_type: Optional[str]) -> Response:
+    return Response(body=_json.dumpb(source, default=_dump_packet), status=status, headers=_json_headers(headers, content_type))
+
+
+def _text_response(source: str, status: int, headers: Optional[LooseHeaders], content_type: Optional[str]) -> Response:
+    return Response(text=source, content_type=content_type, status=status, headers=headers)
+
+
+def _bytes_response(source: bytes, status: int, headers: Optional[LooseHeaders], content_type: Optional[str]) -> Response:
+    return Response(body=source, content_type=content_type, status=status, headers=headers)
+
+
+_response_factories: Dict[Type, _ResponseFactory] = {
+    dict: _json_response,
+    list: _json_response,
+    str: _text_response,
+    bytes: _bytes_response,
+}
+
+
+def _subclass_factory(source: Any) -> _ResponseFactory:
+    if isinstance(source, PacketBase):
+        return _packet_response
+    elif isinstance(source, (dict, list)):
+        return _json_response
+    elif isinstance(source, (bytes, bytearray)):
+        return _bytes_response
+    return _text_response
+
+
+def make_response(source: Union[PacketBase, dict, list, str, bytes], status: int = 200, headers: Optional[LooseHeaders] = None, content_type: Optional[str] = None) -> Response:
     """Create response from server.
     A little sugar to create responses from various types of data
     and automaticaly set the MIME-type.
 
     Args:
-        source (Union[PacketBase, dict, str]): the data to send as a response
+        source (Union[PacketBase, dict, list, str, bytes]): the data to send as a response,
+            packets nested in dicts and lists are dumped too
+        status (int, optional): HTTP status. Defaults to 200.
+        headers (Optional[LooseHeaders], optional): additional headers. Defaults to None.
+        content_type (Optional[str], optional): MIME-type to send instead of the detected one,
+            useful for already encoded bytes bodies. Defaults to None.
+
+    Raises:
+        ValueError: if both `content_type` and Content-Type header in `headers` are set.
 
     Returns:
         Response: generated response
     """
-    rtype: Optional[str] = None
-    if isinstance(source, PacketBase):
-        res, rtype = source.dumps(), 'application/json'
-    elif isinstance(source, dict):
-        res, rtype = json.dumps(source), 'application/json'
-    else:
-        res, rtype = source, None
-    return Response(text=res, content_type=rtype, status=status, headers=headers)
+    factory: Optional[_ResponseFactory] = _response_factories.get(type(source))
+    if factory is None:
+        factory = _subclass_factory(source)
+    return factory(source, status, headers, content_type)
@@ -1,5 +1,6 @@
 # -*- coding:utf-8 -*-
-from typing import Optional, Union, Sequence, Dict, Any, Callable
+from __future__ import annotations
+from typing import Optional, Union, Sequence, Dict, Any, Callable, List
 import asyncio
 import socket
 from ssl import SSLContext
@@ -32,6 +33,7 @@ class WebService(Service):
     __runner: AppRunner
     __access_logger: AbstractAccessLogger
     __access_log_format: str
+    __access_log: bool
     __additional_args: Dict[str, Any]
     __app: WebApplication
 
@@ -46,9 +48,10 @@ class WebService(Service):
         shutdown_timeout: float = 60.0, 
         ssl_context: Optional[SSLContext] = None, 
         reuse_address: Optional[bool] = None, reuse_port: Optional[bool] = None, backlog: int = 128,
-        access_log_class=AccessLogger, access_log_format=AccessLogger.LOG_FORMAT,
+        access_log_class=AccessLogger, access_log_format=AccessLogger.LOG_FORMAT, access_log: bool = True,
         routes: Optional[Union[UrlDispatcher, RouteTableDef]] = None,
         controller_factory: Optional[Callable] = None,
+        controller: Any = None,
         **additional_app_attrs) -> None:
         """Constructor
 
@@ -64,7 +67,10 @@ class WebService(Service):
             backlog (int, optional): the depth of backlog. Defaults to 128.
             access_log_class (_type_, optional): logger class. Defaults to AccessLogger.
             access_log_format (_type_, optional): logger format. Defaults to AccessLogger.LOG_FORMAT.
+            access_log (bool, optional): if False no access log is written at all. Defaults to True.
             routes (Optional[Union[UrlDispatcher, RouteTableDef]], optional): initialized UrlDispatcher with routes or just route table. Defaults to None.
+            controller_factory (Optional[Callable], optional): factory to create the controller for each request. Defaults to None.
+            controller (Any, optional): the controller shared by all the requests, can't be used with controller_factory. Defaults to None.
         """
         super().__init__(linear=False)
         self.__host = [host] if isinstance(host, (str, bytes, bytearray, memoryview)) else host
@@ -78,13 +84,16 @@ class WebService(Service):
         self.__backlog = backlog
         self.__access_logger = access_log_class
         self.__access_log_format = access_log_format
+        self.__access_log = access_log
         self.__controller_factory = controller_factory
+        self.__controller = controller
 
         self.__app = WebApplication(
             logger=self.log,
             loop=self.ioloop,
             router=self._make_router(routes),
-            controller_factory=self.__controller_factory
+            controller_factory=self.__controller_factory,
+            controller=self.__controller
         )
 
         self.__additional_args = additional_app_attrs
@@ -102,7 +111,8 @@ class WebService(Service):
             logger=get_logger(route),
             loop=self.ioloop,
             router=self._make_router(routes),
-            controller_factory=self.__controller_factory 
+            controller_factory=self.__controller_factory,
+            controller=self.__controller
         )
         for attr, value in self.__additional_args.items():
             subapp[attr] = value
@@ -115,16 +125,15 @@ class WebService(Service):
             handle_signals=False,
             access_log_class=self.__access_logger,
             access_log_format=self.__access_log_format,
-            access_log=self.log
+            access_log=self.log if self.__access_log else None
         )
         await self.__runner.setup()
 
-        self.sites: Sequence[BaseSite] = []
-        start_futures = []
+        sites: List[BaseSite] = []
         if self.__host is not None:
             for h in self.__host:
                 self.log.debug(f'Initializing TCPSite "{h}:{self.__port}"')
-                self.sites.append(TCPSite(
+                sites.append(TCPSite(
                     self.__runner, h, self.__port,
                     shutdown_timeout=self.__shutdown_timeout,
                     ssl_context=self.__ssl_context,
@@ -132,10 +141,9 @@ class WebService(Service):
                     reuse_address=self.__reuse_address,
                     reuse_port=self.__reuse_port
                 ))
-                start_futures.append(asyncio.ensure_future(self.sites[-1].start()))
         elif self.__port is not None:
             self.log.debug(f'Initializing TCPSite "0.0.0.0:{self.__port}')
-            self.sites.append(
+            sites.append(
                 TCPSite(
                     self.__runner, port=self.__port,
                     shutdown_timeout=self.__shutdown_timeout,
@@ -145,12 +153,11 @@ class WebService(Service):
                     reuse_port=self.__reuse_port
                 )
             )
-            start_futures.append(asyncio.ensure_future(self.sites[-1].start()))
 
         if self.__path is not None:
             for p in self.__path:
                 self.log.debug(f'Initializing UnixSite "{p}"')
-                self.sites.append(
+                sites.append(
                     UnixSite(
                         self.__runner, p,
                         shutdown_timeout=self.__shutdown_timeout,
@@ -158,12 +165,11 @@ class WebService(Service):
                         backlog=self.__backlog
                     )
                 )
-                start_futures.append(asyncio.ensure_future(self.sites[-1].start()))
 
         if self.__sock is not None:
             for s in self.__sock:
                 self.log.debug(f'Initializing SockSite {s}')
-                self.sites.append(
+                sites.append(
                     SockSite(
                         self.__runner, s,
                         shutdown_timeout=self.__shutdown_timeout,
@@ -171,15 +177,14 @@ class WebService(Service):
                         backlog=self.__backlog
                     )
                 )
-                start_futures.append(asyncio.ensure_future(self.sites[-1].start()))
 
-        await asyncio.gather(*start_futures)
+        self.sites: Sequence[BaseSite] = tuple(sites)
+        await asyncio.gather(*[site.start() for site in self.sites])
         self.log.debug('WebService started succesfully')
 
     async def __stop__(self, *args):
         self.log.debug('Stopping WebService')
-        stop_futures = [asyncio.ensure_future(site.stop()) for site in self.sites]
-        await asyncio.gather(*stop_futures)
+        await asyncio.gather(*[site.stop() for site in self.sites])
         await self.__runner._cleanup_server()
         await self.__runner.shutdown()
         self.log.debug('WebService stopped successfully')
@@ -0,0 +1,33 @@
+# -*- coding:utf-8 -*-
+import json
+import unittest
+from asyncframework.web import _json
+
+
+class JsonAdapterTestCase(unittest.TestCase):
+    def test_non_str_keys(self):
+        self.assertEqual(json.loads(_json.dumpb({1: 'a'})), {'1': 'a'})
+        self.assertEqual(json.loads(_json.dumps({1: 'a'})), {'1': 'a'})
+
+    def test_big_int(self):
+        self.assertEqual(json.loads(_json.dumpb({'a': 2 ** 70})), {'a': 2 ** 70})
+        self.assertEqual(json.loads(_json.dumps({'a': 2 ** 70})), {'a': 2 ** 70})
+
+    def test_loads_big_int(self):
+        self.assertEqual(_json.loads(b'{"id": 12345678901234567890123}'), {'id': 12345678901234567890123})
+        self.assertEqual(_json.loads('{"id": -12345678901234567890123}'), {'id': -12345678901234567890123})
+        self.assertEqual(_json.loads(b'{"id": 123456789012345678}'), {'id': 123456789012345678})
+
+    def test_default(self):
+        self.assertEqual(json.loads(_json.dumpb([{1}], default=list)), [[1]])
+        self.assertEqual(json.loads(_json.dumpb([{2 ** 70}], default=list)), [[2 ** 70]])
+
+    def test_loads(self):
+        self.assertEqual(_json.loads(b'{"a": [1, 2]}'), {'a': [1, 2]})
+        self.assertEqual(_json.loads('{"a": [1, 2]}'), {'a': [1, 2]})
+        with self.assertRaises(ValueError):
+            _json.loads(b'{')
+
+
+if __name__ == '__main__':
+    unittest.main()
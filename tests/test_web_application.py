@@ -0,0 +1,52 @@
+# -*- coding:utf-8 -*-
+import asyncio
+import unittest
+from aiohttp.test_utils import TestClient, TestServer
+from aiohttp.web import RouteTableDef, Response
+from asyncframework.web import WebApplication, WebRequest, with_controller
+
+
+routes = RouteTableDef()
+
+
+@routes.get('/controller')
+@with_controller
+async def controller_name(request: WebRequest, controller: str) -> Response:
+    return Response(text=controller)
+
+
+class WithControllerTestCase(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        async def start_client(app: WebApplication) -> TestClient:
+            app.router.add_routes(routes)
+            client = TestClient(TestServer(app))
+            await client.start_server()
+            return client
+
+        cls.loop = asyncio.new_event_loop()
+        cls.shared_client = cls.loop.run_until_complete(start_client(WebApplication(controller='shared')))
+        cls.factory_client = cls.loop.run_until_complete(start_client(WebApplication(controller_factory=lambda: 'created')))
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.loop.run_until_complete(cls.shared_client.close())
+        cls.loop.run_until_complete(cls.factory_client.close())
+        cls.loop.close()
+
+    def _get(self, client: TestClient) -> str:
+        async def get():
+            resp = await client.get('/controller')
+            self.assertEqual(resp.status, 200)
+            return await resp.text()
+        return self.loop.run_until_complete(get())
+
+    def test_shared_controller(self):
+        self.assertEqual(self._get(self.shared_client), 'shared')
+
+    def test_controller_factory(self):
+        self.assertEqual(self._get(self.factory_client), 'created')
+
+
+if __name__ == '__main__':
+    unittest.main()
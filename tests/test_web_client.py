@@ -0,0 +1,103 @@
+# -*- coding:utf-8 -*-
+import asyncio
+import unittest
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+from asyncframework.web import WebClient, WebClientResponse
+
+
+class WebClientSessionTestCase(unittest.IsolatedAsyncioTestCase):
+    async def test_new_session_is_not_closed_at_once(self):
+        client = WebClient(session_timeout=0.5)
+        await client._init_session()
+        await asyncio.sleep(0.05)
+        self.assertIsNotNone(client._client)
+        self.assertFalse(client._client.closed)
+        await client.close()
+
+    async def test_entered_session_is_not_closed_at_once(self):
+        async with WebClient(session_timeout=0.5) as client:
+            await asyncio.sleep(0.05)
+            self.assertIsNotNone(client._client)
+            self.assertFalse(client._client.closed)
+
+    async def test_reopened_session_is_not_closed_at_once(self):
+        client = WebClient(session_timeout=0.1)
+        await client._init_session()
+        await asyncio.sleep(0.3)
+        self.assertIsNone(client._client)
+        await client._init_session()
+        await asyncio.sleep(0.05)
+        self.assertIsNotNone(client._client)
+        await client.close()
+
+    async def test_idle_session_is_closed_by_timeout(self):
+        client = WebClient(session_timeout=0.1)
+        await client._init_session()
+        await asyncio.sleep(0.3)
+        self.assertIsNone(client._client)
+
+
+class WebClientResponsePoolTestCase(unittest.TestCase):
+    def test_released_response_is_reused(self):
+        first = WebClientResponse.acquire(200, 'GET', 'a', None, {})
+        first.release()
+        second = WebClientResponse.acquire(201, 'POST', 'b', {'b': 1}, {'X': 'y'})
+        self.assertIs(second, first)
+        self.assertEqual((second.status, second.method, second.text, second.json, second.headers), (201, 'POST', 'b', {'b': 1}, {'X': 'y'}))
+        second.release()
+
+    def test_subclass_is_not_pooled(self):
+        class Response(WebClientResponse):
+            __slots__ = []
+
+        WebClientResponse.acquire(200, 'GET', 'a', None, {}).release()
+        response = Response.acquire(200, 'GET', 'a', None, {})
+        self.assertIs(type(response), Response)
+        response.release()
+        self.assertNotIn(response, WebClientResponse._pool)
+
+
+class WebClientResponseTestCase(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        async def utf8(request):
+            return web.Response(body='{"a": "\u0444"}'.encode('utf-8'), content_type='application/json', charset='utf-8')
+
+        async def utf16(request):
+            return web.Response(body='{"a": "\u0444"}'.encode('utf-16'), content_type='application/json', charset='utf-16')
+
+        async def start_server() -> TestServer:
+            app = web.Application()
+            app.router.add_get('/utf8', utf8)
+            app.router.add_get('/utf16', utf16)
+            server = TestServer(app)
+            await server.start_server()
+            return server
+
+        cls.loop = asyncio.new_event_loop()
+        cls.server = cls.loop.run_until_complete(start_server())
+        cls.client = WebClient()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.loop.run_until_complete(cls.client.close())
+        cls.loop.run_until_complete(cls.server.close())
+        cls.loop.close()
+
+    def _get(self, path: str) -> WebClientResponse:
+        return self.loop.run_until_complete(self.client.get(str(self.server.make_url(path))))
+
+    def test_json_in_utf8(self):
+        resp = self._get('/utf8')
+        self.assertEqual(resp.text, '{"a": "\u0444"}')
+        self.assertEqual(resp.json, {'a': '\u0444'})
+
+    def test_json_in_other_charset(self):
+        resp = self._get('/utf16')
+        self.assertEqual(resp.text, '{"a": "\u0444"}')
+        self.assertEqual(resp.json, {'a': '\u0444'})
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,78 @@
+# -*- coding:utf-8 -*-
+import asyncio
+import json
+import unittest
+from typing import Any
+from aiohttp.test_utils import TestClient, TestServer
+from aiohttp.web import RouteTableDef
+from asyncframework.web import WebApplication, WebRequest, WebRequestArgsPacket, make_response
+
+
+class BodyPacket(WebRequestArgsPacket):
+    @classmethod
+    def _load_or_bad_request(cls, data: Any) -> Any:
+        return data
+
+
+routes = RouteTableDef()
+
+
+@routes.get('/args')
+async def args(request: WebRequest):
+    return make_response(list(await request.extract_args('a', 'b', b='default', c='c')))
+
+
+@routes.post('/body')
+async def body(request: WebRequest):
+    return make_response(await BodyPacket.from_request_body(request))
+
+
+class WebRequestTestCase(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        async def start_client() -> TestClient:
+            app = WebApplication()
+            app.router.add_routes(routes)
+            client = TestClient(TestServer(app))
+            await client.start_server()
+            return client
+
+        cls.loop = asyncio.new_event_loop()
+        cls.client = cls.loop.run_until_complete(start_client())
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.loop.run_until_complete(cls.client.close())
+        cls.loop.close()
+
+    def _post_json(self, path: str, data: bytes, content_type: str) -> Any:
+        async def post():
+            resp = await self.client.post(path, data=data, headers={'Content-Type': content_type})
+            self.assertEqual(resp.status, 200)
+            return await resp.json()
+        return self.loop.run_until_complete(post())
+
+    def _get(self, path: str) -> Any:
+        async def get():
+            resp = await self.client.get(path)
+            return resp.status, json.loads(await resp.text()) if resp.status == 200 else None
+        return self.loop.run_until_complete(get())
+
+    def test_extract_args(self):
+        self.assertEqual(self._get('/args?a=1'), (200, ['1', 'default', 'c']))
+        self.assertEqual(self._get('/args?a=1&b=2&c=3'), (200, ['1', '2', '3']))
+        status, _ = self._get('/args?b=2')
+        self.assertEqual(status, 400)
+
+    def test_body_in_utf8(self):
+        body = '{"a": "é"}'.encode('utf-8')
+        self.assertEqual(self._post_json('/body', body, 'application/json'), {'a': 'é'})
+        self.assertEqual(self._post_json('/body', body, 'application/json; charset=utf-8'), {'a': 'é'})
+
+    def test_body_in_other_charset(self):
+        body = '{"a": "é"}'.encode('latin-1')
+        self.assertEqual(self._post_json('/body', body, 'application/json; charset=latin-1'), {'a': 'é'})
+
+
+if __name__ == '__main__':
+    unittest.main()
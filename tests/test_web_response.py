@@ -0,0 +1,38 @@
+# -*- coding:utf-8 -*-
+import json
+import unittest
+from asyncframework.web import make_response
+
+
+class MakeResponseTestCase(unittest.TestCase):
+    def test_json(self):
+        resp = make_response({'a': [1, 2]})
+        self.assertEqual(resp.content_type, 'application/json')
+        self.assertEqual(resp.charset, 'utf-8')
+        self.assertEqual(json.loads(resp.body), {'a': [1, 2]})
+
+    def test_text_and_bytes(self):
+        resp = make_response('OK')
+        self.assertEqual(resp.content_type, 'text/plain')
+        self.assertEqual(resp.body, b'OK')
+        resp = make_response(b'OK', content_type='text/plain')
+        self.assertEqual(resp.content_type, 'text/plain')
+        self.assertEqual(resp.body, b'OK')
+
+    def test_explicit_content_type(self):
+        resp = make_response({}, content_type='application/problem+json')
+        self.assertEqual(resp.content_type, 'application/problem+json')
+
+    def test_content_type_header(self):
+        for source in ({}, [], 'OK', b'OK'):
+            resp = make_response(source, headers={'Content-Type': 'text/html'})
+            self.assertEqual(resp.content_type, 'text/html')
+
+    def test_content_type_header_and_param(self):
+        for source in ({}, [], 'OK', b'OK'):
+            with self.assertRaises(ValueError):
+                make_response(source, headers={'Content-Type': 'text/html'}, content_type='application/problem+json')
+
+
+if __name__ == '__main__':
+    unittest.main()